@@ -11,6 +11,7 @@ Key concepts demonstrated: os, shutil, re, requests, file handling
 
 import sys
 import os
+import importlib.util
 from pathlib import Path
 
 # Add the scripts directory to the Python path so we can import our modules
@@ -18,38 +19,51 @@ scripts_dir = Path(__file__).parent
 sys.path.append(str(scripts_dir))
 
 try:
-    from move_jpg_files import move_jpg_files
-    from extract_emails import extract_emails_from_text, validate_emails
+    from move_jpg_files import move_jpg_files, find_jpg_files
+    from extract_emails import extract_emails_from_text
     from scrape_webpage_title import scrape_webpage_title, scrape_multiple_urls
 except ImportError as e:
     print(f"Error importing modules: {e}")
     print("Make sure all script files are in the same directory.")
     sys.exit(1)
 
+# Project paths used by every task
+_REPO_ROOT = scripts_dir.resolve().parent
+_TEST_DATA = _REPO_ROOT / "test_data"
+_OUTPUT = _REPO_ROOT / "output"
+
+# Whether the requests package can be imported (checked once at startup)
+_HAS_REQUESTS = importlib.util.find_spec("requests") is not None
+
+# Main menu text, built once and printed on every loop iteration
+_MENU = "\n".join([
+    "\n" + "=" * 60,
+    "TASK AUTOMATION DEMO SCRIPT",
+    "=" * 60,
+    "Choose an automation task to run:",
+    "",
+    "1. Move JPG Files",
+    "   - Moves all .jpg/.jpeg files from test_data/images to output/moved_images",
+    "",
+    "2. Extract Email Addresses",
+    "   - Extracts emails from test_data/sample_text_with_emails.txt",
+    "",
+    "3. Scrape Webpage Title",
+    "   - Scrapes title from a webpage and saves it to file",
+    "",
+    "4. Run All Tasks",
+    "   - Demonstrates all three automation tasks",
+    "",
+    "5. Install Required Packages",
+    "   - Install requests package if not available",
+    "",
+    "0. Exit",
+    "=" * 60,
+])
+
 def display_menu():
     """Display the main menu options."""
-    print("\n" + "=" * 60)
-    print("TASK AUTOMATION DEMO SCRIPT")
-    print("=" * 60)
-    print("Choose an automation task to run:")
-    print()
-    print("1. Move JPG Files")
-    print("   - Moves all .jpg/.jpeg files from test_data/images to output/moved_images")
-    print()
-    print("2. Extract Email Addresses") 
-    print("   - Extracts emails from test_data/sample_text_with_emails.txt")
-    print()
-    print("3. Scrape Webpage Title")
-    print("   - Scrapes title from a webpage and saves it to file")
-    print()
-    print("4. Run All Tasks")
-    print("   - Demonstrates all three automation tasks")
-    print()
-    print("5. Install Required Packages")
-    print("   - Install requests package if not available")
-    print()
-    print("0. Exit")
-    print("=" * 60)
+    print(_MENU)
 
 def task_move_jpg_files():
     """Demonstrate the JPG file moving task."""
@@ -57,9 +71,8 @@ def task_move_jpg_files():
     print("TASK 1: MOVE JPG FILES")
     print("-" * 50)
     
-    current_dir = Path(__file__).parent.parent
-    source_folder = current_dir / "test_data" / "images"
-    destination_folder = current_dir / "output" / "moved_images"
+    source_folder = _TEST_DATA / "images"
+    destination_folder = _OUTPUT / "moved_images"
     
     print(f"Source: {source_folder}")
     print(f"Destination: {destination_folder}")
@@ -69,8 +82,7 @@ def task_move_jpg_files():
         return False
     
     # List files before moving
-    image_files = list(source_folder.glob("*.jpg")) + list(source_folder.glob("*.JPG")) + \
-                  list(source_folder.glob("*.jpeg")) + list(source_folder.glob("*.JPEG"))
+    image_files = find_jpg_files(source_folder)
     
     if not image_files:
         print("No image files found to move.")
@@ -101,8 +113,7 @@ def task_extract_emails():
     print("TASK 2: EXTRACT EMAIL ADDRESSES")
     print("-" * 50)
     
-    current_dir = Path(__file__).parent.parent
-    input_file = current_dir / "test_data" / "sample_text_with_emails.txt"
+    input_file = _TEST_DATA / "sample_text_with_emails.txt"
     
     print(f"Input file: {input_file}")
     
@@ -110,13 +121,10 @@ def task_extract_emails():
         print("ERROR: Input file does not exist!")
         return False
     
-    # Extract emails
-    emails, output_file = extract_emails_from_text(input_file)
+    # Extract and validate emails
+    emails, output_file, validation_results = extract_emails_from_text(input_file)
     
     if emails:
-        # Validate emails
-        validation_results = validate_emails(emails)
-        
         print(f"\nSUCCESS: Found {len(emails)} unique email addresses!")
         print(f"Valid emails: {validation_results['total_valid']}")
         print(f"Invalid emails: {validation_results['total_invalid']}")
@@ -215,8 +223,7 @@ def check_environment():
     issues = []
     
     # Check if test data exists
-    current_dir = Path(__file__).parent.parent
-    test_data_dir = current_dir / "test_data"
+    test_data_dir = _TEST_DATA
     
     if not test_data_dir.exists():
         issues.append("test_data directory missing")
@@ -230,9 +237,7 @@ def check_environment():
         issues.append("test_data/images directory missing")
     
     # Check for requests module
-    try:
-        import requests
-    except ImportError:
+    if not _HAS_REQUESTS:
         issues.append("requests module not installed")
     
     if issues:
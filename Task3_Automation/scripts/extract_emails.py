@@ -7,57 +7,107 @@ Key concepts: re (regex), file handling, text processing
 
 import re
 import os
+import mmap
 from pathlib import Path
 from datetime import datetime
 
-def extract_emails_from_text(input_file, output_file=None):
+# Regex pattern for email addresses
+# This pattern matches most common email formats. It is pure ASCII, so it
+# runs directly over the raw file bytes without decoding the whole file.
+# The lookarounds stand in for \b: in bytes mode \b treats the UTF-8 bytes of
+# accented letters as non-word characters, so it would match the ASCII tail of
+# a word such as "Jos\u00e9s@x.com" (giving "s@x.com").
+_EMAIL_RE_BYTES = re.compile(rb'(?<![A-Za-z0-9._%+\-\x80-\xff])[A-Za-z0-9._%+\-]+@[A-Za-z0-9.\-]+\.[A-Za-z]{2,}(?![A-Za-z0-9_\x80-\xff])')
+
+# More strict email validation pattern
+_STRICT_EMAIL_RE = re.compile(r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$')
+
+def extract_and_validate(content):
+    """
+    Find unique email addresses and validate them in a single pass.
+    
+    Args:
+        content (bytes): Raw text to search (bytes or a memory-mapped file)
+    
+    Returns:
+        tuple: (emails, valid_emails, invalid_emails, total_found) - unique emails in
+            first-seen order, the same emails split by the strict pattern, and the
+            number of matches before removing duplicates
+    """
+    emails = []
+    valid_emails = []
+    invalid_emails = []
+    seen = set()
+    total_found = 0
+    
+    for match in _EMAIL_RE_BYTES.finditer(content):
+        total_found += 1
+        email = match.group().decode('ascii')
+        
+        # Skip duplicates (case-insensitive, keeping the first occurrence)
+        key = email.lower()
+        if key in seen:
+            continue
+        seen.add(key)
+        emails.append(email)
+        
+        if _STRICT_EMAIL_RE.match(email):
+            valid_emails.append(email)
+        else:
+            invalid_emails.append(email)
+    
+    return emails, valid_emails, invalid_emails, total_found
+
+def extract_emails_from_text(input_file, output_file=None, verbose=True):
     """
-    Extract email addresses from a text file and save them to another file.
+    Extract and validate email addresses from a text file and save them to another file.
     
     Args:
         input_file (str): Path to the input text file
         output_file (str, optional): Path to the output file. If None, auto-generates filename.
+        verbose (bool): If True, also print every extracted email
     
     Returns:
-        tuple: (email_list, output_file_path) - list of found emails and output file path
+        tuple: (email_list, output_file_path, validation_results) - list of found emails,
+            output file path and a dictionary in the same format as validate_emails()
     """
     input_path = Path(input_file)
     
     # Check if input file exists
     if not input_path.exists():
         print(f"Error: Input file '{input_file}' does not exist.")
-        return [], None
+        return [], None, None
+    
+    # Take the time once; it is used for the filename and the report header
+    extraction_time = datetime.now()
     
     # Generate output filename if not provided
     if output_file is None:
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        timestamp = extraction_time.strftime("%Y%m%d_%H%M%S")
         output_file = input_path.parent / f"extracted_emails_{timestamp}.txt"
     else:
         output_file = Path(output_file)
     
-    # Regex pattern for email addresses
-    # This pattern matches most common email formats
-    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-    
     emails = []
     
     try:
-        # Read the input file
+        # Memory-map the input file and find all email addresses in place
         print(f"Reading file: {input_file}")
-        with open(input_path, 'r', encoding='utf-8', errors='ignore') as file:
-            content = file.read()
+        with open(input_path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                emails, valid_emails, invalid_emails, total_found = [], [], [], 0
+            else:
+                with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    emails, valid_emails, invalid_emails, total_found = extract_and_validate(content)
         
-        # Find all email addresses
-        found_emails = re.findall(email_pattern, content)
+        validation_results = {
+            'valid': valid_emails,
+            'invalid': invalid_emails,
+            'total_valid': len(valid_emails),
+            'total_invalid': len(invalid_emails)
+        }
         
-        # Remove duplicates while preserving order
-        seen = set()
-        for email in found_emails:
-            if email.lower() not in seen:
-                emails.append(email)
-                seen.add(email.lower())
-        
-        print(f"Found {len(found_emails)} email addresses ({len(emails)} unique)")
+        print(f"Found {total_found} email addresses ({len(emails)} unique)")
         
         if emails:
             # Create output directory if it doesn't exist
@@ -66,27 +116,26 @@ def extract_emails_from_text(input_file, output_file=None):
             # Write emails to output file
             with open(output_file, 'w', encoding='utf-8') as file:
                 file.write(f"Email addresses extracted from: {input_file}\n")
-                file.write(f"Extraction date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                file.write(f"Extraction date: {extraction_time.strftime('%Y-%m-%d %H:%M:%S')}\n")
                 file.write(f"Total unique emails found: {len(emails)}\n")
                 file.write("-" * 50 + "\n\n")
                 
-                for i, email in enumerate(emails, 1):
-                    file.write(f"{i}. {email}\n")
+                file.write("".join(f"{i}. {email}\n" for i, email in enumerate(emails, 1)))
             
             print(f"Emails saved to: {output_file}")
             
             # Also display found emails
-            print("\nExtracted emails:")
-            for i, email in enumerate(emails, 1):
-                print(f"  {i}. {email}")
+            if verbose:
+                print("\nExtracted emails:")
+                print("\n".join(f"  {i}. {email}" for i, email in enumerate(emails, 1)))
         else:
             print("No email addresses found in the file.")
             
     except Exception as e:
         print(f"Error processing file: {str(e)}")
-        return [], None
+        return [], None, None
     
-    return emails, str(output_file)
+    return emails, str(output_file), validation_results
 
 def validate_emails(email_list):
     """
@@ -98,14 +147,11 @@ def validate_emails(email_list):
     Returns:
         dict: Dictionary with validation results
     """
-    # More strict email validation pattern
-    strict_pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    
     valid_emails = []
     invalid_emails = []
     
     for email in email_list:
-        if re.match(strict_pattern, email):
+        if _STRICT_EMAIL_RE.match(email):
             valid_emails.append(email)
         else:
             invalid_emails.append(email)
@@ -132,13 +178,10 @@ def main():
     print(f"Output directory: {output_dir}")
     print("-" * 50)
     
-    # Extract emails
-    emails, output_file = extract_emails_from_text(input_file)
+    # Extract and validate emails
+    emails, output_file, validation_results = extract_emails_from_text(input_file)
     
     if emails:
-        # Validate emails
-        validation_results = validate_emails(emails)
-        
         print("-" * 50)
         print("Validation Results:")
         print(f"Valid emails: {validation_results['total_valid']}")
@@ -162,14 +205,12 @@ def main():
                 if validation_results['valid']:
                     file.write("Valid Emails:\n")
                     file.write("-" * 15 + "\n")
-                    for email in validation_results['valid']:
-                        file.write(f"{email}\n")
+                    file.write("".join(f"{email}\n" for email in validation_results['valid']))
                 
                 if validation_results['invalid']:
                     file.write("\nEmails Needing Review:\n")
                     file.write("-" * 25 + "\n")
-                    for email in validation_results['invalid']:
-                        file.write(f"{email}\n")
+                    file.write("".join(f"{email}\n" for email in validation_results['invalid']))
             
             print(f"Validation report saved to: {validation_file}")
 
@@ -6,16 +6,71 @@ Key concepts: os, shutil, file handling
 """
 
 import os
+import errno
 import shutil
 from pathlib import Path
 
-def move_jpg_files(source_folder, destination_folder):
+# File extensions treated as JPG images (compared case-insensitively)
+JPG_EXTENSIONS = ('.jpg', '.jpeg')
+
+# Short descriptions for the errno values expected when moving a single file
+MOVE_ERROR_REASONS = {
+    errno.ENOENT: "source file no longer exists",
+    errno.EACCES: "permission denied",
+    errno.EPERM: "operation not permitted",
+    errno.EEXIST: "destination already exists",
+    errno.ENOSPC: "no space left on device",
+}
+
+# Buffered progress lines are printed whenever this many have accumulated
+PROGRESS_FLUSH_EVERY = 100
+
+# Batches larger than this are renamed relative to open directory descriptors
+DIR_FD_BATCH_THRESHOLD = 128
+
+def _exists_in_dir(dir_fd, name):
     """
-    Move all .jpg files from source folder to destination folder.
+    Check whether an entry exists relative to an open directory descriptor.
+    
+    Args:
+        dir_fd (int): Descriptor of the directory to look in
+        name (str): Entry name inside that directory
+    
+    Returns:
+        bool: True if the entry exists, like Path.exists()
+    """
+    try:
+        os.stat(name, dir_fd=dir_fd)
+    except (FileNotFoundError, NotADirectoryError):
+        return False
+    return True
+
+def find_jpg_files(source_folder):
+    """
+    Find all .jpg/.jpeg files (case-insensitive) directly inside a folder.
+    
+    Args:
+        source_folder (str): Path to the folder to search
+    
+    Returns:
+        list: Path objects for the matching files
+    """
+    # A single scandir pass visits each entry once; DirEntry.is_file() can
+    # usually answer from the directory listing without an extra stat call
+    with os.scandir(source_folder) as entries:
+        return [Path(entry.path) for entry in entries
+                if entry.is_file() and entry.name.lower().endswith(JPG_EXTENSIONS)]
+
+def move_jpg_files(source_folder, destination_folder, verbose=True):
+    """
+    Move all .jpg/.jpeg files (case-insensitive) from source folder to destination folder.
     
     Args:
         source_folder (str): Path to the source folder containing .jpg files
         destination_folder (str): Path to the destination folder
+        verbose (bool): If True, print a line for every file that was moved,
+            skipped or failed. Lines are printed every PROGRESS_FLUSH_EVERY files,
+            and the rest when the loop ends or is interrupted
     
     Returns:
         tuple: (moved_count, error_list) - number of files moved and list of errors
@@ -35,11 +90,11 @@ def move_jpg_files(source_folder, destination_folder):
     
     moved_count = 0
     errors = []
+    progress = []
     
     try:
         # Find all .jpg files (case-insensitive)
-        jpg_files = list(source_path.glob("*.jpg")) + list(source_path.glob("*.JPG")) + \
-                   list(source_path.glob("*.jpeg")) + list(source_path.glob("*.JPEG"))
+        jpg_files = find_jpg_files(source_path)
         
         if not jpg_files:
             print("No .jpg files found in the source folder.")
@@ -47,25 +102,80 @@ def move_jpg_files(source_folder, destination_folder):
         
         print(f"Found {len(jpg_files)} image files to move...")
         
-        for jpg_file in jpg_files:
-            try:
-                # Create destination file path
-                dest_file = dest_path / jpg_file.name
-                
-                # Check if file already exists in destination
-                if dest_file.exists():
-                    print(f"Warning: {jpg_file.name} already exists in destination. Skipping...")
-                    continue
-                
-                # Move the file
-                shutil.move(str(jpg_file), str(dest_file))
-                print(f"Moved: {jpg_file.name}")
-                moved_count += 1
+        # A plain rename is enough when both folders are on the same filesystem;
+        # shutil.move is only needed to copy across devices
+        same_fs = source_path.stat().st_dev == dest_path.stat().st_dev
+        
+        # For large batches, check and rename relative to open directory
+        # descriptors so the kernel does not resolve both folder paths again
+        # for every file
+        use_dir_fds = (same_fs and len(jpg_files) > DIR_FD_BATCH_THRESHOLD
+                       and os.rename in os.supports_dir_fd
+                       and os.stat in os.supports_dir_fd)
+        src_fd = dst_fd = None
+        
+        try:
+            if use_dir_fds:
+                src_fd = os.open(source_path, os.O_RDONLY | os.O_DIRECTORY)
+                dst_fd = os.open(dest_path, os.O_RDONLY | os.O_DIRECTORY)
+            
+            for jpg_file in jpg_files:
+                # Print buffered progress in batches so long runs still show output
+                if len(progress) >= PROGRESS_FLUSH_EVERY:
+                    print("\n".join(progress))
+                    progress.clear()
                 
-            except Exception as e:
-                error_msg = f"Error moving {jpg_file.name}: {str(e)}"
-                errors.append(error_msg)
-                print(f"Error: {error_msg}")
+                try:
+                    # Create destination file path
+                    dest_file = dest_path / jpg_file.name
+                    
+                    # Check if file already exists in destination
+                    if dst_fd is not None:
+                        exists = _exists_in_dir(dst_fd, jpg_file.name)
+                    else:
+                        exists = dest_file.exists()
+                    if exists:
+                        if verbose:
+                            progress.append(f"Warning: {jpg_file.name} already exists in destination. Skipping...")
+                        continue
+                    
+                    # Move the file
+                    if same_fs:
+                        try:
+                            if src_fd is not None:
+                                # os.rename is listed in os.supports_dir_fd (os.replace is
+                                # not) and behaves the same on POSIX
+                                os.rename(jpg_file.name, jpg_file.name, src_dir_fd=src_fd, dst_dir_fd=dst_fd)
+                            else:
+                                os.replace(jpg_file, dest_file)
+                        except OSError as e:
+                            # Separate mounts of one filesystem (e.g. bind mounts) share
+                            # st_dev but still refuse renames between them
+                            if e.errno != errno.EXDEV:
+                                raise
+                            shutil.move(str(jpg_file), str(dest_file))
+                    else:
+                        shutil.move(str(jpg_file), str(dest_file))
+                    if verbose:
+                        progress.append(f"Moved: {jpg_file.name}")
+                    moved_count += 1
+                    
+                except OSError as e:
+                    # Describe the expected errno values briefly, anything else in full
+                    reason = MOVE_ERROR_REASONS.get(e.errno, str(e))
+                    error_msg = f"Error moving {jpg_file.name}: {reason}"
+                    errors.append(error_msg)
+                    if verbose:
+                        progress.append(f"Error: {error_msg}")
+        finally:
+            for fd in (src_fd, dst_fd):
+                if fd is not None:
+                    os.close(fd)
+            
+            # Print the remaining progress even if the batch was interrupted,
+            # so files that were already moved are still reported
+            if progress:
+                print("\n".join(progress))
         
         print(f"\nOperation completed! Moved {moved_count} files.")
         if errors:
@@ -5,14 +5,106 @@ This script scrapes the title of a webpage and saves it to a file.
 Key concepts: requests, HTML parsing, web scraping, file handling
 """
 
-import requests
-import re
 import os
+import string
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from datetime import datetime
+from html import unescape
 from urllib.parse import urlparse
 
-def scrape_webpage_title(url, output_file=None, timeout=10):
+# requests (and urllib3 with it) is slow to import, so it is loaded on
+# first use by _get_requests() rather than at module import
+_requests = None
+
+# Translation table that replaces every ASCII character not allowed in
+# output filenames with an underscore
+_ALLOWED_NETLOC_CHARS = set(string.ascii_letters + string.digits + '-_.')
+_NETLOC_TABLE = {c: '_' for c in range(128) if chr(c) not in _ALLOWED_NETLOC_CHARS}
+
+# Stop reading the body after this many bytes if no title was found
+_MAX_TITLE_SCAN_BYTES = 65536
+
+# Bodies up to this size (by Content-Length) are read to the end after the
+# title is found so the connection can go back to the session's pool; for
+# larger or unsized bodies, dropping the connection is cheaper than draining it
+_MAX_DRAIN_BYTES = 262144
+
+def _get_requests():
+    """
+    Import the requests package on first use and cache it.
+    
+    Returns:
+        module: The requests module
+    """
+    global _requests
+    if _requests is None:
+        import requests as _requests
+    return _requests
+
+def _read_title_bytes(response, chunk_size=4096):
+    """
+    Read a streamed response only until the <title> tag has been seen.
+    
+    The tag is located with plain bytes.find calls on a lowercased copy of
+    the buffer, which is cheaper than running a regex over the page. Each new
+    chunk only rescans the tail of the buffer that a match could straddle.
+    
+    Args:
+        response (requests.Response): Response opened with stream=True
+        chunk_size (int): Number of bytes to read at a time
+    
+    Returns:
+        bytes: Raw title contents, or None if no title tag was found
+    """
+    buffer = bytearray()
+    lowered = bytearray()
+    tag_start = content_start = -1
+    for chunk in response.iter_content(chunk_size=chunk_size):
+        previous_len = len(lowered)
+        buffer += chunk
+        lowered += chunk.lower()
+        search_from = max(0, previous_len - len(b"</title>"))
+        if tag_start < 0:
+            tag_start = lowered.find(b"<title", search_from)
+        if tag_start >= 0 and content_start < 0:
+            content_start = lowered.find(b">", max(tag_start, search_from))
+        if content_start >= 0:
+            content_end = lowered.find(b"</title>", max(content_start, search_from))
+            if content_end >= 0:
+                return bytes(buffer[content_start + 1:content_end])
+        if len(buffer) > _MAX_TITLE_SCAN_BYTES:
+            break
+    return None
+
+def _release_response(response, chunk_size=65536):
+    """
+    Drain the rest of a small streamed response so its connection is reused.
+    
+    Draining is best effort: nothing is done if the body was already read to
+    the end, and read errors are ignored so an already extracted title is kept.
+    
+    Args:
+        response (requests.Response): Response opened with stream=True
+        chunk_size (int): Number of bytes to read at a time while draining
+    """
+    # The whole body was read while looking for the title (requests would
+    # raise StreamConsumedError on a second iter_content call)
+    if response._content_consumed:
+        return
+    
+    try:
+        content_length = int(response.headers.get('Content-Length', ''))
+    except ValueError:
+        return
+    if content_length <= _MAX_DRAIN_BYTES:
+        try:
+            for _ in response.iter_content(chunk_size=chunk_size):
+                pass
+        except _get_requests().exceptions.RequestException:
+            pass
+
+def scrape_webpage_title(url, output_file=None, timeout=10, session=None):
     """
     Scrape the title of a webpage and save it to a file.
     
@@ -20,10 +112,14 @@ def scrape_webpage_title(url, output_file=None, timeout=10):
         url (str): URL of the webpage to scrape
         output_file (str, optional): Path to the output file. If None, auto-generates filename.
         timeout (int): Request timeout in seconds
+        session (requests.Session, optional): Session to reuse pooled connections.
+            If None, a one-off session from create_session() is used.
     
     Returns:
         tuple: (title, output_file_path, status_code) - scraped title, output file path, HTTP status
     """
+    requests = _get_requests()
+    
     try:
         # Validate URL format
         parsed_url = urlparse(url)
@@ -38,30 +134,39 @@ def scrape_webpage_title(url, output_file=None, timeout=10):
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
         
-        # Make the HTTP request
-        response = requests.get(url, headers=headers, timeout=timeout)
-        status_code = response.status_code
+        # Make the HTTP request, streaming the body so only the head is downloaded.
+        # Transient failures are retried by the session's adapter.
+        http = session if session is not None else create_session(pool_size=1)
+        try:
+            with http.get(url, headers=headers, timeout=timeout, stream=True) as response:
+                status_code = response.status_code
+                raw_title = _read_title_bytes(response) if status_code == 200 else None
+                encoding = response.encoding or 'utf-8'
+                _release_response(response)
+        finally:
+            if session is None:
+                http.close()
         
-        if response.status_code == 200:
-            # Extract title using regex
-            # This pattern looks for <title>...</title> tags (case-insensitive)
-            title_pattern = r'<title[^>]*>(.*?)</title>'
-            title_match = re.search(title_pattern, response.text, re.IGNORECASE | re.DOTALL)
-            
-            if title_match:
+        if status_code == 200:
+            if raw_title is not None:
                 # Get the title and clean it up
-                title = title_match.group(1).strip()
+                try:
+                    title = raw_title.decode(encoding, errors='ignore')
+                except LookupError:
+                    # Unknown charset in the Content-Type header
+                    title = raw_title.decode('utf-8', errors='ignore')
+                title = title.strip()
+                # Decode HTML entities (named and numeric)
+                title = unescape(title)
                 # Remove extra whitespace and newlines
-                title = re.sub(r'\s+', ' ', title)
-                # Decode HTML entities (basic ones)
-                title = title.replace('&amp;', '&').replace('&lt;', '<').replace('&gt;', '>').replace('&quot;', '"')
+                title = ' '.join(title.split())
                 
                 print(f"Title found: {title}")
                 
                 # Generate output filename if not provided
                 if output_file is None:
                     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    safe_domain = re.sub(r'[^\w\-_\.]', '_', parsed_url.netloc)
+                    safe_domain = parsed_url.netloc.translate(_NETLOC_TABLE)
                     output_file = Path(__file__).parent.parent / "output" / f"webpage_title_{safe_domain}_{timestamp}.txt"
                 else:
                     output_file = Path(output_file)
@@ -91,12 +196,6 @@ def scrape_webpage_title(url, output_file=None, timeout=10):
             print(f"Error: HTTP {status_code} - Failed to fetch the webpage")
             return None, None, status_code
             
-    except requests.exceptions.Timeout:
-        print(f"Error: Request timed out after {timeout} seconds")
-        return None, None, None
-    except requests.exceptions.ConnectionError:
-        print("Error: Connection failed. Check your internet connection or URL.")
-        return None, None, None
     except requests.exceptions.RequestException as e:
         print(f"Error: Request failed - {str(e)}")
         return None, None, None
@@ -104,13 +203,44 @@ def scrape_webpage_title(url, output_file=None, timeout=10):
         print(f"Unexpected error: {str(e)}")
         return None, None, None
 
-def scrape_multiple_urls(urls, output_dir=None):
+def create_session(pool_size=32):
+    """
+    Create a requests session with a pooled, retrying HTTP adapter.
+    
+    Connection errors, read errors and 5xx responses to GET/HEAD requests are
+    retried with exponential backoff. After the last retry a 5xx response is
+    returned as-is so its status code can still be reported.
+    
+    Args:
+        pool_size (int): Maximum number of connections kept per host
+    
+    Returns:
+        requests.Session: Session with the adapter mounted for http and https
+    """
+    requests = _get_requests()
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+    
+    retry = Retry(total=3, connect=2, read=2, backoff_factor=0.3,
+                  status_forcelist=(500, 502, 503, 504),
+                  allowed_methods=frozenset(['GET', 'HEAD']),
+                  raise_on_status=False)
+    
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size,
+                          max_retries=retry)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def scrape_multiple_urls(urls, output_dir=None, max_workers=16):
     """
-    Scrape titles from multiple URLs and save them to individual files.
+    Scrape titles from multiple URLs concurrently and save them to individual files.
     
     Args:
         urls (list): List of URLs to scrape
         output_dir (str, optional): Directory to save output files
+        max_workers (int): Maximum number of URLs fetched at the same time
     
     Returns:
         dict: Dictionary with results for each URL
@@ -123,34 +253,52 @@ def scrape_multiple_urls(urls, output_dir=None):
     output_dir.mkdir(parents=True, exist_ok=True)
     
     results = {}
-    successful_scrapes = 0
     
     print(f"Scraping {len(urls)} URLs...")
     print("=" * 50)
     
+    # Generate individual output files up front, one job per input position
+    # (all files in the batch share one timestamp)
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    jobs = []
     for i, url in enumerate(urls, 1):
-        print(f"\n{i}/{len(urls)}: Processing {url}")
-        
-        # Generate individual output file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         parsed_url = urlparse(url)
-        safe_domain = re.sub(r'[^\w\-_\.]', '_', parsed_url.netloc)
-        individual_output = output_dir / f"title_{i:02d}_{safe_domain}_{timestamp}.txt"
-        
-        title, output_file, status_code = scrape_webpage_title(url, individual_output)
-        
-        results[url] = {
-            'title': title,
-            'output_file': output_file,
-            'status_code': status_code,
-            'success': title is not None
-        }
-        
-        if title:
-            successful_scrapes += 1
+        safe_domain = parsed_url.netloc.translate(_NETLOC_TABLE)
+        jobs.append((i, url, output_dir / f"title_{i:02d}_{safe_domain}_{timestamp}.txt"))
+    
+    # Network I/O releases the GIL, so the requests can overlap in threads.
+    # The session pool is sized to match the number of workers.
+    workers = max(1, min(max_workers, len(jobs)))
+    session = create_session(pool_size=workers)
+    completed = {}
+    try:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(scrape_webpage_title, url, path, 10, session): (i, url)
+                for i, url, path in jobs
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                i, url = futures[future]
+                title, output_file, status_code = future.result()
+                print(f"\n{done}/{len(futures)}: Finished {url}")
+                
+                completed[i] = {
+                    'title': title,
+                    'output_file': output_file,
+                    'status_code': status_code,
+                    'success': title is not None
+                }
+    finally:
+        session.close()
+    
+    # Keep results in the order the URLs were given
+    for i, url, _ in jobs:
+        results[url] = completed[i]
+    
+    successful_scrapes = sum(1 for result in completed.values() if result['success'])
     
     # Create a summary report
-    summary_file = output_dir / f"scraping_summary_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+    summary_file = output_dir / f"scraping_summary_{timestamp}.txt"
     with open(summary_file, 'w', encoding='utf-8') as file:
         file.write(f"Bulk Web Scraping Summary\n")
         file.write("=" * 30 + "\n\n")
@@ -161,14 +309,16 @@ def scrape_multiple_urls(urls, output_dir=None):
         
         file.write("Results:\n")
         file.write("-" * 10 + "\n")
+        lines = []
         for i, (url, result) in enumerate(results.items(), 1):
             status = "SUCCESS" if result['success'] else "FAILED"
-            file.write(f"{i}. {status} - {url}\n")
+            lines.append(f"{i}. {status} - {url}\n")
             if result['title']:
-                file.write(f"   Title: {result['title'][:80]}{'...' if len(result['title']) > 80 else ''}\n")
+                lines.append(f"   Title: {result['title'][:80]}{'...' if len(result['title']) > 80 else ''}\n")
             if result['status_code']:
-                file.write(f"   HTTP Status: {result['status_code']}\n")
-            file.write("\n")
+                lines.append(f"   HTTP Status: {result['status_code']}\n")
+            lines.append("\n")
+        file.write("".join(lines))
     
     print(f"\nSummary saved to: {summary_file}")
     return results